@@ -48,6 +48,13 @@ PLAYER_START_Y = SCREEN_HEIGHT / 4
 RIGHT_FACING = 0
 LEFT_FACING = 1
 
+# Buckets into PlayerCharacter's texture table (walk frames follow)
+BUCKET_CLIMB = -1
+BUCKET_IDLE = 0
+BUCKET_JUMP = 1
+BUCKET_FALL = 2
+BUCKET_WALK = 3
+
 LAYER_NAME_PLATFORMS = "Platforms"
 LAYER_NAME_PLATFORMS_1 = "Platforms_1"
 LAYER_NAME_PLATFORMS_2 = "Platforms_2"
@@ -57,7 +64,37 @@ LAYER_NAME_PLAYER = "Player"
 LAYER_NAME_DECORATIONS = "Decorations"
 #LAYER_NAME_GROUND = "Ground"
 #LAYER_NAME_TEXT = "Text"
-NON_BACKGROUND_LAYERS = [LAYER_NAME_PLATFORMS, LAYER_NAME_PLATFORMS_1, LAYER_NAME_PLATFORMS_2, LAYER_NAME_PLAYER, LAYER_NAME_COINS, LAYER_NAME_DECORATIONS]
+NON_BACKGROUND_LAYERS = frozenset({LAYER_NAME_PLATFORMS, LAYER_NAME_PLATFORMS_1, LAYER_NAME_PLATFORMS_2, LAYER_NAME_PLAYER, LAYER_NAME_COINS, LAYER_NAME_DECORATIONS})
+
+# Layer Specific Options for the Tilemap
+LAYER_OPTIONS_LEVEL_1 = {
+    LAYER_NAME_PLATFORMS: {
+        "use_spatial_hash": True,
+    },
+    LAYER_NAME_COINS: {
+        "use_spatial_hash": True,
+    },
+}
+LAYER_OPTIONS = {
+    LAYER_NAME_PLATFORMS: {
+        "use_spatial_hash": True,
+    },
+    LAYER_NAME_PLATFORMS_1: {
+        "use_spatial_hash": True,
+    },
+    LAYER_NAME_PLATFORMS_2: {
+        "use_spatial_hash": True,
+    },
+    # LAYER_NAME_DECORATIONS: {
+    #     "use_spatial_hash": True
+    # },
+    LAYER_NAME_COINS: {
+        "use_spatial_hash": True,
+    },
+}
+
+# Per-level vertical scale applied to the map's text object positions
+TEXT_Y_SCALE = (0.62, 1, 1, 1.3)
 
 
 # Define the ends of each map
@@ -67,6 +104,49 @@ END_OF_MAP = [7.25,12.26,12.26,12.26]
 FADE_RATE = 5
 
 
+def animation_state(change_x, change_y, is_on_ladder, climbing, face_direction, cur_texture):
+    """
+    Pure state transition for the player animation, run once per frame.
+
+    Returns (face_direction, climbing, cur_texture, bucket) where bucket
+    indexes the player's texture table, or BUCKET_CLIMB for the climbing
+    textures.
+    """
+    # Figure out if we need to flip face left or right
+    if change_x < 0 and face_direction == RIGHT_FACING:
+        face_direction = LEFT_FACING
+    elif change_x > 0 and face_direction == LEFT_FACING:
+        face_direction = RIGHT_FACING
+
+    # Climbing animation
+    if is_on_ladder:
+        climbing = True
+    elif climbing:
+        climbing = False
+    if climbing:
+        if abs(change_y) > 1:
+            cur_texture += 1
+            if cur_texture > 7:
+                cur_texture = 0
+        return face_direction, climbing, cur_texture, BUCKET_CLIMB
+
+    # Jumping animation
+    if change_y > 0 and not is_on_ladder:
+        return face_direction, climbing, cur_texture, BUCKET_JUMP
+    elif change_y < 0 and not is_on_ladder:
+        return face_direction, climbing, cur_texture, BUCKET_FALL
+
+    # Idle animation
+    if change_x == 0:
+        return face_direction, climbing, cur_texture, BUCKET_IDLE
+
+    # Walking animation
+    cur_texture += 1
+    if cur_texture > 7:
+        cur_texture = 0
+    return face_direction, climbing, cur_texture, BUCKET_WALK + cur_texture
+
+
 def load_texture_pair(filename):
     """
     Load a texture pair, with the second being a mirror image.
@@ -77,6 +157,37 @@ def load_texture_pair(filename):
     ]
 
 
+# Decoded assets shared across view instances, so restarting the game
+# doesn't re-decode the sounds and menu images
+_SOUND_CACHE = {}
+_TEXTURE_CACHE = {}
+
+
+def load_sound_cached(path):
+    """Load a sound once per process and reuse the decoded object."""
+    sound = _SOUND_CACHE.get(path)
+    if sound is None:
+        sound = _SOUND_CACHE[path] = arcade.load_sound(path)
+    return sound
+
+
+# Sounds GameView needs, warmed up while the start menu is shown
+GAME_SOUND_PATHS = (
+    "resources/sounds/coin1.wav",
+    "resources/sounds/jump1.wav",
+    "resources/sounds/JKL83NH-video-game-win.mp3",
+    "resources/sounds/Stardew Valley OST - Spring (Wild Horseradish Jam).mp3",
+)
+
+
+def load_texture_cached(name, path):
+    """Decode an image into an arcade.Texture once per process."""
+    texture = _TEXTURE_CACHE.get(name)
+    if texture is None:
+        texture = _TEXTURE_CACHE[name] = arcade.Texture(name, PIL.Image.open(path))
+    return texture
+
+
 class PlayerCharacter(arcade.Sprite):
     """Player Sprite"""
 
@@ -120,6 +231,13 @@ class PlayerCharacter(arcade.Sprite):
         texture = arcade.load_texture(f"{main_path}_climb1.png")
         self.climbing_textures.append(texture)
 
+        # Texture pairs indexed by the bucket ids animation_state returns
+        self.texture_table = [
+            self.idle_texture_pair,
+            self.jump_texture_pair,
+            self.fall_texture_pair,
+        ] + self.walk_textures
+
         # Set the initial texture
         self.texture = self.idle_texture_pair[0]
 
@@ -130,45 +248,23 @@ class PlayerCharacter(arcade.Sprite):
 
     def update_animation(self, delta_time: float = 1 / 60):
 
-        # Figure out if we need to flip face left or right
-        if self.change_x < 0 and self.character_face_direction == RIGHT_FACING:
-            self.character_face_direction = LEFT_FACING
-        elif self.change_x > 0 and self.character_face_direction == LEFT_FACING:
-            self.character_face_direction = RIGHT_FACING
-
-        # Climbing animation
-        if self.is_on_ladder:
-            self.climbing = True
-        if not self.is_on_ladder and self.climbing:
-            self.climbing = False
-        if self.climbing and abs(self.change_y) > 1:
-            self.cur_texture += 1
-            if self.cur_texture > 7:
-                self.cur_texture = 0
-        if self.climbing:
+        (
+            self.character_face_direction,
+            self.climbing,
+            self.cur_texture,
+            bucket,
+        ) = animation_state(
+            self.change_x,
+            self.change_y,
+            self.is_on_ladder,
+            self.climbing,
+            self.character_face_direction,
+            self.cur_texture,
+        )
+        if bucket == BUCKET_CLIMB:
             self.texture = self.climbing_textures[self.cur_texture // 4]
-            return
-
-        # Jumping animation
-        if self.change_y > 0 and not self.is_on_ladder:
-            self.texture = self.jump_texture_pair[self.character_face_direction]
-            return
-        elif self.change_y < 0 and not self.is_on_ladder:
-            self.texture = self.fall_texture_pair[self.character_face_direction]
-            return
-
-        # Idle animation
-        if self.change_x == 0:
-            self.texture = self.idle_texture_pair[self.character_face_direction]
-            return
-
-        # Walking animation
-        self.cur_texture += 1
-        if self.cur_texture > 7:
-            self.cur_texture = 0
-        self.texture = self.walk_textures[self.cur_texture][
-            self.character_face_direction
-        ]
+        else:
+            self.texture = self.texture_table[bucket][self.character_face_direction]
 
 
 class GameView(arcade.View):
@@ -185,10 +281,6 @@ class GameView(arcade.View):
         #super().__init__(SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_TITLE)
         super().__init__()
 
-        # Set the path to start with this program
-        file_path = os.path.dirname(os.path.abspath(__file__))
-        os.chdir(file_path)
-
         # Track the current state of what key is pressed
         self.left_pressed = False
         self.right_pressed = False
@@ -219,11 +311,15 @@ class GameView(arcade.View):
         # Keep track of the score
         self.score = 0
 
-        # Load sounds
-        self.collect_coin_sound = arcade.load_sound("resources/sounds/coin1.wav")
-        self.jump_sound = arcade.load_sound("resources/sounds/jump1.wav")
-        self.victory_sound = arcade.load_sound("resources/sounds/JKL83NH-video-game-win.mp3")
-        self.theme_music = arcade.load_sound("resources/sounds/Stardew Valley OST - Spring (Wild Horseradish Jam).mp3")
+        # Load sounds (decoded once per process, shared across restarts)
+        self.collect_coin_sound = load_sound_cached("resources/sounds/coin1.wav")
+        self.jump_sound = load_sound_cached("resources/sounds/jump1.wav")
+        self.victory_sound = load_sound_cached("resources/sounds/JKL83NH-video-game-win.mp3")
+        self.theme_music = load_sound_cached("resources/sounds/Stardew Valley OST - Spring (Wild Horseradish Jam).mp3")
+
+        # Text built from the map's "Text" layer, cached per level
+        self._texts = []
+        self._score_text = None
 
         # Level
         self.level = 1
@@ -231,8 +327,16 @@ class GameView(arcade.View):
         self.level_over = False
         self.next_level = False
 
-        # Parallax
-        self.camera_x_prev = PLAYER_START_X
+        # Set when the victory sound starts so the end-of-game transition
+        # can wait without blocking the event loop
+        self._victory_end_time = None
+
+        # Parallax cameras, one per scrolling background layer, with the
+        # fraction of the main camera's pan each layer follows
+        self._parallax_cameras = {}
+        self._parallax_layers = []
+        self._layer_names = []
+        self._non_player_layer_names = []
 
     def setup(self):
         """Set up the game here. Call this function to restart the game."""
@@ -246,48 +350,21 @@ class GameView(arcade.View):
 
         # Keep track of the score
         self.score = 0
+        self._score_text.text = f"Score: {self.score}"
 
         self.play_sound = arcade.play_sound(self.theme_music, looping=True)
 
     def load_level(self, level):
         # Layer Specific Options for the Tilemap
         if self.level > 1: #and self.level < 4:
-            layer_options = {
-                LAYER_NAME_PLATFORMS: {
-                    "use_spatial_hash": True,
-                },
-                LAYER_NAME_PLATFORMS_1: {
-                    "use_spatial_hash": True,
-                },
-                LAYER_NAME_PLATFORMS_2: {
-                    "use_spatial_hash": True,
-                },
-                # LAYER_NAME_DECORATIONS: {
-                #     "use_spatial_hash": True
-                # },
-                #LAYER_NAME_MOVING_PLATFORMS: {
-                #    "use_spatial_hash": False,
-                #},
-                #LAYER_NAME_LADDERS: {
-                #    "use_spatial_hash": True,
-                #},
-                LAYER_NAME_COINS: {
-                "use_spatial_hash": True,
-                },
-            }
+            layer_options = LAYER_OPTIONS
         else:
-            layer_options = {
-                LAYER_NAME_PLATFORMS: {
-                    "use_spatial_hash": True,
-                },
-                LAYER_NAME_COINS: {
-                "use_spatial_hash": True,
-                },
-            }
+            layer_options = LAYER_OPTIONS_LEVEL_1
 
         # Read in the tiled map
+        map_path = Path(f"resources/maps/level_{level}.json")
         self.tile_map = arcade.load_tilemap(
-            f"resources/maps/level_{level}.json", TILE_SCALING, layer_options,
+            map_path, TILE_SCALING, layer_options,
             # TEST
             #":resources:tiled_maps/map_with_ladders.json", TILE_SCALING, layer_options,
         )
@@ -311,21 +388,18 @@ class GameView(arcade.View):
         self.end_of_map = END_OF_MAP[level-1] * GRID_PIXEL_SIZE
         # self.end_of_map = self.tile_map.width * GRID_PIXEL_SIZE
 
+        # Keep each platform layer as its own list so the spatial hash
+        # built by load_tilemap stays intact; extending one list into
+        # another would bypass it
+        wall_lists = [self.tile_map.sprite_lists[LAYER_NAME_PLATFORMS]]
         if level > 1:
-            self.tile_map.sprite_lists[LAYER_NAME_PLATFORMS].extend(self.tile_map.sprite_lists[LAYER_NAME_PLATFORMS+"_1"])
-            self.tile_map.sprite_lists[LAYER_NAME_PLATFORMS].extend(self.tile_map.sprite_lists[LAYER_NAME_PLATFORMS+"_2"])
-        # elif level == 3:
-        #     self.tile_map.sprite_lists[LAYER_NAME_PLATFORMS].extend(self.tile_map.sprite_lists[LAYER_NAME_PLATFORMS+"_1"])
-            # self.tile_map.sprite_lists[LAYER_NAME_PLATFORMS].extend(self.tile_map.sprite_lists[LAYER_NAME_PLATFORMS+"_2"])
-            # self.tile_map.sprite_lists[LAYER_NAME_PLATFORMS].extend(self.tile_map.sprite_lists[LAYER_NAME_PLATFORMS+"_3"])
-        # elif level == 4:
-            # self.tile_map.sprite_lists[LAYER_NAME_PLATFORMS].extend(self.tile_map.sprite_lists[LAYER_NAME_PLATFORMS+"_1"])
+            wall_lists.append(self.tile_map.sprite_lists[LAYER_NAME_PLATFORMS+"_1"])
+            wall_lists.append(self.tile_map.sprite_lists[LAYER_NAME_PLATFORMS+"_2"])
 
         self.physics_engine = arcade.PhysicsEnginePlatformer(
             self.player_sprite,
-            self.tile_map.sprite_lists[LAYER_NAME_PLATFORMS],
             gravity_constant=GRAVITY,
-            # walls=self.scene[LAYER_NAME_PLATFORMS],
+            walls=wall_lists,
         )
 
         # --- Other stuff
@@ -340,16 +414,110 @@ class GameView(arcade.View):
 
         self.background_layer_names = sorted( [ name for name in self.scene.name_mapping.keys() if name not in NON_BACKGROUND_LAYERS] )
 
-        self.camera_x_prev = PLAYER_START_X
+        # One scrolling camera per parallax layer: panning a camera is a
+        # single matrix update at draw time instead of a position write
+        # per background sprite every frame
+        self._parallax_cameras = {}
+        self._parallax_layers = []
+        if level > 1:
+            for count, sprite_name in enumerate(self.background_layer_names):
+                if level == 4 and count == 3:
+                    continue
+                camera = arcade.Camera(self.window.width, self.window.height)
+                self._parallax_cameras[sprite_name] = camera
+                # Fraction of the main camera's pan this layer follows
+                self._parallax_layers.append((camera, 1 - 1 / ((count + 4) * 0.25)))
+
+        # Layer draw order, as the scene draws them. The player layer is
+        # drawn separately after the map text so it stays in front
+        self._layer_names = list(self.scene.name_mapping)
+        self._non_player_layer_names = [
+            name for name in self._layer_names if name != LAYER_NAME_PLAYER
+        ]
 
-    def on_draw(self):
-        """Render the screen."""
+        # Pre-populate the shared texture atlas with every texture the
+        # level can draw, so it grows here rather than rebuilding
+        # mid-frame the first time a texture appears on screen
+        atlas = self.window.ctx.default_atlas
+        for sprite_list in self.scene.name_mapping.values():
+            for sprite in sprite_list:
+                atlas.add(sprite.texture)
+        for texture_pair in self.player_sprite.texture_table:
+            for texture in texture_pair:
+                atlas.add(texture)
+        for texture in self.player_sprite.climbing_textures:
+            atlas.add(texture)
+
+        # Parse the "Text" layer objects once per level, so on_draw never
+        # touches the map JSON
+        pytiled_map = parse(map_path)
+        text_objects = [
+            t_obj
+            for layer in pytiled_map.layers
+            if layer.name == "Text"
+            for t_obj in layer.tiled_objects
+        ]
 
-        # Determine font color
-        if self.level == 1:
+        # Build the text objects once; arcade.Text caches the glyph layout,
+        # arcade.draw_text re-lays it out on every call
+        self._texts = []
+        for t_obj in text_objects:
+            if t_obj.font_family == "Chalkduster":
+                font = "Chalkduster"
+            else:
+                font = "American Typewriter"
+            self._texts.append(
+                arcade.Text(
+                    t_obj.text,
+                    t_obj.coordinates[0]/32 * GRID_PIXEL_SIZE/TILE_SCALING,
+                    t_obj.coordinates[1]/32 * GRID_PIXEL_SIZE/TILE_SCALING*TEXT_Y_SCALE[level-1],
+                    t_obj.color,
+                    t_obj.font_size*3,
+                    t_obj.size.width*4,
+                    t_obj.horizontal_align,
+                    font,
+                    # anchor_x=t_obj.horizontal_align,
+                    # anchor_y=t_obj.vertical_align,
+                    multiline=t_obj.wrap,
+                )
+            )
+
+        if level == 1:
             font_color = arcade.color.BLACK
         else:
             font_color = arcade.color.WHITE
+        self._score_text = arcade.Text(
+            f"Score: {self.score}",
+            10,
+            10,
+            font_color,
+            18,
+            font_name="American Typewriter",
+        )
+
+        # Level-complete overlay, laid out once per level; the score line
+        # is filled in when the final level ends
+        self._well_done_text = arcade.Text(
+            "",
+            SCREEN_WIDTH / 2,
+            3 * SCREEN_HEIGHT / 4,
+            font_color,
+            30,
+            font_name="American Typewriter",
+            anchor_x="center",
+        )
+        self._continue_text = arcade.Text(
+            "Press <space> to continue",
+            SCREEN_WIDTH / 2,
+            SCREEN_HEIGHT / 2,
+            font_color,
+            30,
+            font_name="American Typewriter",
+            anchor_x="center",
+        )
+
+    def on_draw(self):
+        """Render the screen."""
 
         # Clear the screen to the background color
         self.clear()
@@ -357,71 +525,40 @@ class GameView(arcade.View):
         # Activate the game camera
         self.camera.use()
 
-        # Draw our Scene
-        self.scene.draw()
+        # Draw our Scene, switching to the matching parallax camera for
+        # each scrolling background layer
+        if self._parallax_cameras:
+            # Every Camera.use() call advances the position lerp, so pin
+            # the goal after the first step above; otherwise the camera
+            # follow speeds up with each re-use() in the layer loop
+            self.camera.goal_position = self.camera.position
+            for sprite_name in self._non_player_layer_names:
+                self._parallax_cameras.get(sprite_name, self.camera).use()
+                self.scene.draw([sprite_name])
+            self.camera.use()
+        else:
+            self.scene.draw(self._non_player_layer_names)
 
         # Manually draw text
-        y_scale = [0.62, 1, 1, 1.3]
-        pytiled_map = parse(Path(f"resources/maps/level_{self.level}.json"))
-        for layer in pytiled_map.layers:
-            if layer.name == "Text":
-                tiled_objects = layer.tiled_objects
-                for t_obj in tiled_objects:
-                    if t_obj.font_family == "Chalkduster":
-                        font = "Chalkduster"
-                    else:
-                        font = "American Typewriter"
-                    arcade.draw_text(
-                        t_obj.text,
-                        t_obj.coordinates[0]/32 * GRID_PIXEL_SIZE/TILE_SCALING,
-                        t_obj.coordinates[1]/32 * GRID_PIXEL_SIZE/TILE_SCALING*y_scale[self.level-1],
-                        t_obj.color,
-                        t_obj.font_size*3,
-                        t_obj.size.width*4,
-                        t_obj.horizontal_align,
-                        font,
-                        # anchor_x=t_obj.horizontal_align,
-                        # anchor_y=t_obj.vertical_align,
-                        multiline=t_obj.wrap,
-                    )
-
-        # Redraw player in front
-        self.scene.draw(["Player"])
+        for text in self._texts:
+            text.draw()
+
+        # Draw the player in front of the text
+        self.scene.draw([LAYER_NAME_PLAYER])
 
         # Activate the GUI camera before drawing GUI elements
         self.gui_camera.use()
 
         # Draw our score on the screen, scrolling it with the viewport
-        score_text = f"Score: {self.score}"
-        arcade.draw_text(
-            score_text,
-            10,
-            10,
-            font_color,
-            18,
-            font_name="American Typewriter",
-        )
+        self._score_text.draw()
 
         if self.level_over:
             if self.level == 4:
-                arcade.draw_text(
-                    f"Well done! Your score was: {self.score}",
-                    SCREEN_WIDTH / 2,
-                    3 * SCREEN_HEIGHT / 4,
-                    font_color,
-                    30,
-                    font_name="American Typewriter",
-                    anchor_x="center",
-                )
-            arcade.draw_text(
-                    "Press <space> to continue",
-                    SCREEN_WIDTH / 2,
-                    SCREEN_HEIGHT / 2,
-                    font_color,
-                    30,
-                    font_name="American Typewriter",
-                    anchor_x="center",
-                )
+                score_line = f"Well done! Your score was: {self.score}"
+                if self._well_done_text.text != score_line:
+                    self._well_done_text.text = score_line
+                self._well_done_text.draw()
+            self._continue_text.draw()
 
     def process_keychange(self):
         """
@@ -506,28 +643,36 @@ class GameView(arcade.View):
     def on_update(self, delta_time):
         """Movement and game logic"""
 
-        # Update level
-        if self.player_sprite.right >= self.end_of_map:
-            if self.level == 4 and not self.level_over:
-                arcade.play_sound(self.victory_sound)
-                time.sleep(2)
-            if self.level < self.max_level:
-                self.level_over = True
-                if self.next_level:
-                    self.level_over = False
-                    self.next_level = False
+        # Once the level is over, only watch for the <space> transition;
+        # physics, animation and collision can sit idle under the overlay
+        if self.level_over:
+            if self.next_level:
+                self.level_over = False
+                self.next_level = False
+                if self.level < self.max_level:
                     self.level += 1
                     self.load_level(self.level)
                     self.player_sprite.center_x = SCREEN_WIDTH
                     self.player_sprite.center_y = SCREEN_HEIGHT / 2
                     self.player_sprite.change_x = 0
                     self.player_sprite.change_y = 0
-            else:
-                arcade.stop_sound(self.play_sound)
-                self.level_over = True
-                if self.next_level:
+                else:
                     end_view = EndView()
                     self.window.show_view(end_view)
+            return
+
+        # Update level
+        if self.player_sprite.right >= self.end_of_map:
+            if self.level == self.max_level:
+                # Give the victory sound two seconds to play; a sleep here
+                # would freeze input, drawing and audio for the duration
+                if self._victory_end_time is None:
+                    arcade.play_sound(self.victory_sound)
+                    self._victory_end_time = time.monotonic() + 2.0
+                if time.monotonic() < self._victory_end_time:
+                    return
+                arcade.stop_sound(self.play_sound)
+            self.level_over = True
 
         else:
             # Move the player with the physics engine
@@ -546,58 +691,36 @@ class GameView(arcade.View):
                 self.player_sprite.is_on_ladder = False
                 self.process_keychange()
 
-            # Parallax background
-            self.camera_x = self.camera.position[0]
-            if self.level > 1:
-                for count, sprite_name in enumerate(self.background_layer_names):
-                    if self.level == 4 and count == 3:
-                        pass
-                    else:
-                        for sprite in self.scene.name_mapping[sprite_name]:
-                            sprite.left += (self.camera_x - self.camera_x_prev) / ((count + 4) * 0.25)
-
-            self.camera_x_prev = self.camera_x
-                    
-                    # layer = count // 2      0, 0, 1, 1
-                    # frame = count % 2       0, 1, 0, 1
-                    # offset = camera_x / (2 ** (layer + 1))   c/2, c/2, c/4, c/4    
-                    # jump = (camera_x - offset) // sprite.width    c/2, c/2, 3c/4, 3c/4
-                    # final_offset = offset + (jump + frame) * sprite.width 
-                    # sprite.left = final_offset
-
-            # Update Animations
-            if self.level == 1:
-                self.scene.update_animation(
-                #    delta_time, [LAYER_NAME_COINS, LAYER_NAME_BACKGROUND, LAYER_NAME_PLAYER]
-                    delta_time, [LAYER_NAME_COINS, LAYER_NAME_PLAYER, LAYER_NAME_DECORATIONS],
-                )
-            else:
-                layer_names = NON_BACKGROUND_LAYERS + self.background_layer_names
-                self.scene.update_animation(
-                #    delta_time, [LAYER_NAME_COINS, LAYER_NAME_BACKGROUND, LAYER_NAME_PLAYER]
-                    delta_time, layer_names,
-                )
+            # Parallax background: pan each layer's camera at a fraction
+            # of the main camera instead of moving the layer's sprites
+            camera_x, camera_y = self.camera.position
+            for camera, factor in self._parallax_layers:
+                camera.move_to((camera_x * factor, camera_y), 1.0)
+
+            # Update Animations. Only these layers have animated textures;
+            # platforms and the background tiles are static
+            self.scene.update_animation(
+                delta_time, [LAYER_NAME_COINS, LAYER_NAME_PLAYER, LAYER_NAME_DECORATIONS],
+            )
 
             # Update walls, used with moving platforms
             #self.scene.update([LAYER_NAME_MOVING_PLATFORMS])
 
-            # See if we hit any coins
+            # See if we hit any coins. The Coins layer is loaded with
+            # use_spatial_hash, so auto-select would take the hash branch
+            # anyway; method=1 pins it there so the check can't drift onto
+            # another path if the layer options ever change
             coin_hit_list = arcade.check_for_collision_with_list(
-               self.player_sprite, self.scene[LAYER_NAME_COINS]
+               self.player_sprite, self.scene[LAYER_NAME_COINS], method=1
             )
 
-            # Loop through each coin we hit (if any) and remove it
-            for coin in coin_hit_list:
-
-            #     Figure out how many points this coin is worth
-                # if "Points" not in coin.properties:
-                #     print("Warning, collected a coin without a Points property.")
-                # else:
-                    # points = int(coin.properties["Points"])
-                self.score += 10
-
-            #     Remove the coin
-                coin.remove_from_sprite_lists()
+            # Remove the coins we hit (if any) in one pass; the score and
+            # sound are updated once per frame rather than once per coin
+            if coin_hit_list:
+                for coin in coin_hit_list:
+                    coin.remove_from_sprite_lists()
+                self.score += 10 * len(coin_hit_list)
+                self._score_text.text = f"Score: {self.score}"
                 arcade.play_sound(self.collect_coin_sound)
 
             # Position the camera
@@ -609,6 +732,12 @@ class FadingView(arcade.View):
         self.fade_out = None
         self.fade_in = 255
 
+        # Fullscreen black sprite reused for both fades; drawing it from
+        # a SpriteList keeps the geometry cached on the GPU, unlike
+        # draw_rectangle_filled which re-uploads it every call
+        self._fade_sprite = None
+        self._fade_list = None
+
     def update_fade(self, next_view=None, setup=True):
         if self.fade_out is not None:
             self.fade_out += FADE_RATE
@@ -622,16 +751,24 @@ class FadingView(arcade.View):
             if self.fade_in <= 0:
                 self.fade_in = None
 
+    def draw_fade(self, alpha):
+        if self._fade_list is None:
+            self._fade_sprite = arcade.SpriteSolidColor(
+                self.window.width, self.window.height, arcade.color.BLACK
+            )
+            self._fade_sprite.center_x = self.window.width / 2
+            self._fade_sprite.center_y = self.window.height / 2
+            self._fade_list = arcade.SpriteList()
+            self._fade_list.append(self._fade_sprite)
+        self._fade_sprite.alpha = min(alpha, 255)
+        self._fade_list.draw()
+
     def draw_fading(self):
         if self.fade_out is not None:
-            arcade.draw_rectangle_filled(self.window.width / 2, self.window.height / 2,
-                                         self.window.width, self.window.height,
-                                         (0, 0, 0, self.fade_out))
+            self.draw_fade(self.fade_out)
 
         if self.fade_in is not None:
-            arcade.draw_rectangle_filled(self.window.width / 2, self.window.height / 2,
-                                         self.window.width, self.window.height,
-                                         (0, 0, 0, self.fade_in))
+            self.draw_fade(self.fade_in)
 
 class StartView(FadingView):
     """ Class that manages the 'menu' view. """
@@ -642,33 +779,32 @@ class StartView(FadingView):
     def on_show_view(self):
         """ Called when switching to this view"""
         arcade.set_background_color(arcade.color.WHITE)
+        self._bg_texture = load_texture_cached("bckgd", "resources/images/Bottle Background.png")
+        self._door_texture = load_texture_cached("door", "resources/images/Sprites + Stone Objects/Sprites/11-Door/Idle.png")
+        self._flask_texture = load_texture_cached("erlenmeyer", "resources/images/MegaPixelArt32x32pxIcons_SpriteSheet/erlenmeyer_flask.png")
+        # Warm the sound cache while the menu is idle so constructing
+        # GameView doesn't stall decoding the theme music
+        for path in GAME_SOUND_PATHS:
+            load_sound_cached(path)
+        self._texts = [
+            arcade.Text("Welcome to WhyChem, a world where you can explore chemistry!", SCREEN_WIDTH // 2, 39*SCREEN_HEIGHT // 72,
+                         arcade.color.BLACK, font_size=30, anchor_x="center", align="center", multiline=True, width = SCREEN_WIDTH * 13/16, font_name="American Typewriter"),
+            arcade.Text("Collect", SCREEN_WIDTH * 5 / 16, SCREEN_HEIGHT * 25 / 64,
+                         arcade.color.BLACK, font_size=20, anchor_x="center", align="right", multiline=True, width = SCREEN_WIDTH * 6/16, font_name="American Typewriter"),
+            arcade.Text("Advance Using", SCREEN_WIDTH * 5 / 16, SCREEN_HEIGHT * 39 / 128,
+                         arcade.color.BLACK, font_size=20, anchor_x="center", align="right", multiline=True, width = SCREEN_WIDTH * 6/16, font_name="American Typewriter"),
+            arcade.Text("Press <space>\nto continue", SCREEN_WIDTH // 2, SCREEN_HEIGHT * 1 / 8,
+                         arcade.color.BLACK, font_size=30, anchor_x="center", align="center", multiline=True, width = SCREEN_WIDTH * 13/16, font_name="American Typewriter"),
+        ]
 
     def on_draw(self):
         """ Draw the menu """
         self.clear()
-        image = PIL.Image.open("resources/images/Bottle Background.png")
-        texture = arcade.Texture("bckgd", image)
-        arcade.draw_texture_rectangle(SCREEN_WIDTH / 2, 10 * SCREEN_HEIGHT / 18, 1000, 650, texture)
-        arcade.load_font("resources/fonts/Chalkduster.ttf")
-        arcade.load_font("resources/fonts/AmericanTypewriterRegular.ttf")
-        text = arcade.Text("Welcome to WhyChem, a world where you can explore chemistry!", SCREEN_WIDTH // 2, 39*SCREEN_HEIGHT // 72,
-                         arcade.color.BLACK, font_size=30, anchor_x="center", align="center", multiline=True, width = SCREEN_WIDTH * 13/16, font_name="American Typewriter")
-        text.draw()
-        text = arcade.Text("Collect", SCREEN_WIDTH * 5 / 16, SCREEN_HEIGHT * 25 / 64,
-                         arcade.color.BLACK, font_size=20, anchor_x="center", align="right", multiline=True, width = SCREEN_WIDTH * 6/16, font_name="American Typewriter")
-        text.draw()
-        text = arcade.Text("Advance Using", SCREEN_WIDTH * 5 / 16, SCREEN_HEIGHT * 39 / 128,
-                         arcade.color.BLACK, font_size=20, anchor_x="center", align="right", multiline=True, width = SCREEN_WIDTH * 6/16, font_name="American Typewriter")
-        text.draw()
-        text = arcade.Text("Press <space>\nto continue", SCREEN_WIDTH // 2, SCREEN_HEIGHT * 1 / 8,
-                         arcade.color.BLACK, font_size=30, anchor_x="center", align="center", multiline=True, width = SCREEN_WIDTH * 13/16, font_name="American Typewriter")
-        text.draw()
-        image = PIL.Image.open("resources/images/Sprites + Stone Objects/Sprites/11-Door/Idle.png")
-        texture = arcade.Texture("door", image)
-        arcade.draw_texture_rectangle(550, 210, 50, 50, texture)
-        image = PIL.Image.open("resources/images/MegaPixelArt32x32pxIcons_SpriteSheet/erlenmeyer_flask.png")
-        texture = arcade.Texture("erlenmeyer", image)
-        arcade.draw_texture_rectangle(550, 270, 50, 50, texture)
+        arcade.draw_texture_rectangle(SCREEN_WIDTH / 2, 10 * SCREEN_HEIGHT / 18, 1000, 650, self._bg_texture)
+        for text in self._texts:
+            text.draw()
+        arcade.draw_texture_rectangle(550, 210, 50, 50, self._door_texture)
+        arcade.draw_texture_rectangle(550, 270, 50, 50, self._flask_texture)
         self.draw_fading()
 
     def on_key_press(self, key, _modifiers):
@@ -690,28 +826,26 @@ class EndView(FadingView):
     def on_show_view(self):
         """ Called when switching to this view"""
         arcade.set_background_color(arcade.color.WHITE)
+        self._bg_texture = load_texture_cached("endscrn", "resources/images/EndScreen.png")
+        self._texts = [
+            arcade.Text("With chemistry\nyou can...", SCREEN_WIDTH * 49/64,  SCREEN_HEIGHT * 12 / 16,
+                         arcade.color.BLACK, font_size=30, anchor_x="center", align="left", multiline=True, width = SCREEN_WIDTH * 18/64, font_name="American Typewriter"),
+            arcade.Text("travel to new places", SCREEN_WIDTH * 11/16,  SCREEN_HEIGHT * 8 / 16,
+                         arcade.color.BLACK, font_size=24, anchor_x="center", align="center", multiline=True, width = SCREEN_WIDTH * 1/4, font_name="American Typewriter", rotation=4),
+            arcade.Text("learn new things", SCREEN_WIDTH * 20/32,  SCREEN_HEIGHT * 7 / 32,
+                         arcade.color.BLACK, font_size=24, anchor_x="center", align="center", multiline=True, width = SCREEN_WIDTH * 1/4, font_name="American Typewriter", rotation=-20),
+            arcade.Text("create a better world around you", SCREEN_WIDTH * 47/64,  SCREEN_HEIGHT * 6 / 16,
+                         arcade.color.BLACK, font_size=24, anchor_x="center", align="center", multiline=True, width = SCREEN_WIDTH * 3/8, font_name="American Typewriter", rotation=20),
+            arcade.Text("Press <space> to continue", SCREEN_WIDTH // 2, SCREEN_HEIGHT // 18,
+                         arcade.color.BLACK, font_size=24, anchor_x="center", align="center", multiline=True, width = SCREEN_WIDTH * 3/4, font_name="American Typewriter"),
+        ]
 
     def on_draw(self):
         """ Draw the menu """
         self.clear()
-        image = PIL.Image.open("resources/images/EndScreen.png")
-        texture = arcade.Texture("endscrn", image)
-        arcade.draw_texture_rectangle(SCREEN_WIDTH / 2, 11 * SCREEN_HEIGHT / 18, 1000, 650, texture)
-        text = arcade.Text("With chemistry\nyou can...", SCREEN_WIDTH * 49/64,  SCREEN_HEIGHT * 12 / 16,
-                         arcade.color.BLACK, font_size=30, anchor_x="center", align="left", multiline=True, width = SCREEN_WIDTH * 18/64, font_name="American Typewriter")
-        text.draw()
-        text = arcade.Text("travel to new places", SCREEN_WIDTH * 11/16,  SCREEN_HEIGHT * 8 / 16,
-                         arcade.color.BLACK, font_size=24, anchor_x="center", align="center", multiline=True, width = SCREEN_WIDTH * 1/4, font_name="American Typewriter", rotation=4)
-        text.draw()
-        text = arcade.Text("learn new things", SCREEN_WIDTH * 20/32,  SCREEN_HEIGHT * 7 / 32,
-                         arcade.color.BLACK, font_size=24, anchor_x="center", align="center", multiline=True, width = SCREEN_WIDTH * 1/4, font_name="American Typewriter", rotation=-20)
-        text.draw()
-        text = arcade.Text("create a better world around you", SCREEN_WIDTH * 47/64,  SCREEN_HEIGHT * 6 / 16,
-                         arcade.color.BLACK, font_size=24, anchor_x="center", align="center", multiline=True, width = SCREEN_WIDTH * 3/8, font_name="American Typewriter", rotation=20)
-        text.draw()
-        text = arcade.Text("Press <space> to continue", SCREEN_WIDTH // 2, SCREEN_HEIGHT // 18,
-                         arcade.color.BLACK, font_size=24, anchor_x="center", align="center", multiline=True, width = SCREEN_WIDTH * 3/4, font_name="American Typewriter")
-        text.draw()
+        arcade.draw_texture_rectangle(SCREEN_WIDTH / 2, 11 * SCREEN_HEIGHT / 18, 1000, 650, self._bg_texture)
+        for text in self._texts:
+            text.draw()
         self.draw_fading()
 
     def on_key_press(self, key, _modifiers):
@@ -732,19 +866,20 @@ class EndView2(FadingView):
     def on_show_view(self):
         """ Called when switching to this view"""
         arcade.set_background_color(arcade.color.WHITE)
+        self._arcade_texture = load_texture_cached("arcade", "resources/images/arcade-logo.png")
+        self._python_texture = load_texture_cached("python", "resources/images/python-logo.png")
+        self._texts = [
+            arcade.Text("Thanks for playing!\n\nThis game was written in the Python programming language, and created using the Arcade library.\n\nPress <space> to restart game", SCREEN_WIDTH // 2, SCREEN_HEIGHT * 5 / 8,
+                         arcade.color.BLACK, font_size=30, anchor_x="center", align="center", multiline=True, width = SCREEN_WIDTH * 3/4, font_name="American Typewriter"),
+        ]
 
     def on_draw(self):
         """ Draw the menu """
         self.clear()
-        image = PIL.Image.open("resources/images/arcade-logo.png")
-        texture = arcade.Texture("arcade", image)
-        arcade.draw_texture_rectangle(SCREEN_WIDTH * 13 / 16, SCREEN_HEIGHT * 8 / 10, 200, 200, texture)
-        image = PIL.Image.open("resources/images/python-logo.png")
-        texture = arcade.Texture("python", image)
-        arcade.draw_texture_rectangle(SCREEN_WIDTH * 5 / 16, SCREEN_HEIGHT * 8 / 10, 600, 200, texture)
-        text = arcade.Text("Thanks for playing!\n\nThis game was written in the Python programming language, and created using the Arcade library.\n\nPress <space> to restart game", SCREEN_WIDTH // 2, SCREEN_HEIGHT * 5 / 8,
-                         arcade.color.BLACK, font_size=30, anchor_x="center", align="center", multiline=True, width = SCREEN_WIDTH * 3/4, font_name="American Typewriter")
-        text.draw()
+        arcade.draw_texture_rectangle(SCREEN_WIDTH * 13 / 16, SCREEN_HEIGHT * 8 / 10, 200, 200, self._arcade_texture)
+        arcade.draw_texture_rectangle(SCREEN_WIDTH * 5 / 16, SCREEN_HEIGHT * 8 / 10, 600, 200, self._python_texture)
+        for text in self._texts:
+            text.draw()
         self.draw_fading()
 
     def on_key_press(self, key, _modifiers):
@@ -758,9 +893,15 @@ class EndView2(FadingView):
 
 def main():
     """Main function"""
+    # Set the path to start with this program
     if getattr(sys, 'frozen', False) and hasattr(sys, '_MEIPASS'):
         os.chdir(sys._MEIPASS)
+    else:
+        os.chdir(os.path.dirname(os.path.abspath(__file__)))
     window = arcade.Window(SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_TITLE)
+    # Register the fonts once; loading them per draw re-reads the files
+    arcade.load_font("resources/fonts/Chalkduster.ttf")
+    arcade.load_font("resources/fonts/AmericanTypewriterRegular.ttf")
     start_view = StartView()
     window.show_view(start_view)
     # end_view = EndView()